@@ -307,7 +307,7 @@ async def capture_preview(service: CameraService = Depends(get_camera_service)):
             content=image_data,
             media_type="image/jpeg",
             headers={
-                "X-Image-Size": str(len(image_data)),
+                "X-Image-Size": str(image_data.nbytes),
                 "X-Timestamp": datetime.now().isoformat(),
                 "Cache-Control": "no-cache",  # Prevent caching of live preview
             },
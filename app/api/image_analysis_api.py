@@ -362,10 +362,7 @@ async def clear_session_analysis(session_id: str, session_service: SessionServic
             analysis_dir.mkdir(exist_ok=True)
 
         # Clear focus scores from session
-        session = session_service.get_session(session_id)
-        for image in session.images:
-            image.focus_score = None
-        session_service._save_session(session)
+        session_service.clear_focus_scores(session_id)
 
         return {"message": f"Analysis data cleared for session {session_id}"}
 
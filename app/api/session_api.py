@@ -13,14 +13,14 @@ from app.models.session_models import (
 )
 from app.services.session_service import SessionService, SessionNotFoundError
 from app.services.camera_service import CameraService
-from app.dependancies import get_camera_service
+from app.dependancies import get_camera_service, session_service
 from app.exceptions.camera_exceptions import CameraNotConnectedError, CameraCaptureError
 
 
 logger = logging.getLogger(__name__)
 
-# Create session service instance
-session_service = SessionService()
+# Shared with the v2 routers: SessionService caches and debounces writes in memory,
+# so every router has to go through the one instance
 
 router = APIRouter(
     prefix="/sessions",
@@ -1,4 +1,4 @@
-from fastapi import Depends, Query
+from fastapi import Depends, Query, Response
 from app.api.base_router import BaseAPIRouter
 from app.dependancies import get_camera_service
 from app.exceptions.camera_exceptions import (
@@ -23,6 +23,7 @@ from app.utils.response_helpers import (
     create_status_response,
     create_connection_response,
     create_success_response,
+    handle_service_error,
     raise_http_exception,
     status,
 )
@@ -165,10 +166,23 @@ class CameraAPIRouter(BaseAPIRouter):
                 request.image_name
             )
         
-        @self.router.post("/preview", response_model=SuccessResponse)
+        @self.router.post("/preview")
         async def capture_preview(service: CameraService = Depends(get_camera_service)):
             """Capture a preview image"""
-            return self.handle_operation("capture preview", service.preview)
+            self.logger.info("Starting operation: capture preview")
+
+            try:
+                image_data = service.preview()
+            except Exception as e:
+                self.logger.error(f"Operation failed: capture preview - {str(e)}")
+                handle_service_error(e, "capture preview")
+
+            # Serve the JPEG straight from the camera buffer
+            return Response(
+                content=image_data,
+                media_type="image/jpeg",
+                headers={"Cache-Control": "no-cache"},
+            )
         
         @self.router.get("/config/", response_model=SuccessResponse)
         async def get_camera_config(
@@ -41,8 +41,11 @@ def get_session_service() -> SessionService:
     """Get the session service singleton instance."""
     global _session_service
     if _session_service is None:
-        logger.info("Initializing session service")
-        _session_service = SessionService()
+        # Reuse the instance the routers share; a second SessionService would hold its own
+        # unflushed session changes
+        from app.dependancies import session_service
+
+        _session_service = session_service
     return _session_service
 
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, SerializationInfo, field_validator, model_serializer, model_validator
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -23,6 +23,10 @@ class CapturePlan(BaseModel):
     filter: str = Field(default="none", description="Filter being used")
 
 
+# Serialization context for writing sessions to disk, keeps internal fields hidden from API output
+PERSIST_CONTEXT = {"persist": True}
+
+
 class SessionStatistics(BaseModel):
     total_captures: int = 0
     successful_captures: int = 0
@@ -30,6 +34,32 @@ class SessionStatistics(BaseModel):
     total_exposure_time: str = "0s"
     average_focus_score: Optional[float] = None
 
+    # Running totals behind average_focus_score (None on sessions saved before they existed).
+    # Internal bookkeeping: only written to session.json, see PERSIST_CONTEXT
+    focus_score_sum: Optional[float] = Field(default=None, exclude=True)
+    focus_score_count: Optional[int] = Field(default=None, exclude=True)
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler, info: SerializationInfo):
+        """Add the excluded focus score totals back when dumping for storage"""
+        data = handler(self)
+        if info.context and info.context.get("persist"):
+            data["focus_score_sum"] = self.focus_score_sum
+            data["focus_score_count"] = self.focus_score_count
+        return data
+
+    def add_focus_score(self, focus_score: float):
+        """Fold a new focus score into the running average"""
+        self.focus_score_sum = (self.focus_score_sum or 0.0) + focus_score
+        self.focus_score_count = (self.focus_score_count or 0) + 1
+        self.average_focus_score = self.focus_score_sum / self.focus_score_count
+
+    def reset_focus_scores(self):
+        """Clear the running focus score aggregate"""
+        self.focus_score_sum = 0.0
+        self.focus_score_count = 0
+        self.average_focus_score = None
+
 
 class SessionImage(BaseModel):
     filename: str
@@ -51,9 +81,37 @@ class Session(BaseModel):
     statistics: SessionStatistics = Field(default_factory=SessionStatistics)
     images: List[SessionImage] = Field(default_factory=list)
 
-    def update_timestamp(self):
+    @model_validator(mode="after")
+    def backfill_focus_score_totals(self):
+        """Derive running focus score totals for sessions saved before they were tracked"""
+        if self.statistics.focus_score_count is None:
+            focus_scores = [img.focus_score for img in self.images if img.focus_score is not None]
+            self.statistics.focus_score_sum = float(sum(focus_scores))
+            self.statistics.focus_score_count = len(focus_scores)
+        return self
+
+    def update_timestamp(self, now: Optional[datetime] = None):
         """Update the updated_at timestamp"""
-        self.updated_at = datetime.now()
+        self.updated_at = now or datetime.now()
+
+
+class SessionSummary(BaseModel):
+    """Session header without the image list, as returned when listing sessions"""
+
+    id: str
+    name: str
+    target: str
+    created_at: datetime
+    updated_at: datetime
+    status: SessionStatus = SessionStatus.ACTIVE
+    camera_settings: Optional[CameraCaptureSettings] = None
+    capture_plan: CapturePlan = Field(default_factory=CapturePlan)
+    statistics: SessionStatistics = Field(default_factory=SessionStatistics)
+
+    @classmethod
+    def from_session(cls, session: Session) -> "SessionSummary":
+        """Build a summary from an already loaded session"""
+        return cls.model_construct(**{name: getattr(session, name) for name in cls.model_fields})
 
 
 # Request/Response models for API
@@ -74,7 +132,7 @@ class CreateSessionResponse(BaseModel):
 
 
 class SessionListResponse(BaseModel):
-    sessions: List[Session]
+    sessions: List[SessionSummary]
     active_session_id: Optional[str] = None
 
 
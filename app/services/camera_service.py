@@ -1,3 +1,4 @@
+import os
 import subprocess
 import gphoto2 as gp
 import logging
@@ -28,7 +29,54 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _iter_widgets(root: gp.CameraWidget):
+    """
+    Yield every widget below ``root`` in the order libgphoto2's get_child_by_name() searches:
+    a widget's direct children are all checked before descending into the first of them.
+    """
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        children = [widget.get_child(i) for i in range(widget.count_children())]
+        yield from children
+        stack.extend(reversed(children))
+
+
+def _find_widgets(root: gp.CameraWidget, names) -> dict[str, gp.CameraWidget]:
+    """
+    Build a name -> widget map for the requested names with a single traversal of the config tree,
+    stopping as soon as all of them are found.
+    The first widget found wins, matching get_child_by_name() semantics.
+    """
+    wanted = set(names)
+    index = {}
+    if not wanted:
+        return index
+
+    for widget in _iter_widgets(root):
+        name = widget.get_name()
+        if name in wanted and name not in index:
+            index[name] = widget
+            if len(index) == len(wanted):
+                break
+    return index
+
+
 class CameraServiceConfig:
+    # Many of these are built per config request, one per widget in the tree
+    __slots__ = (
+        "id",
+        "name",
+        "type",
+        "parent_id",
+        "root_id",
+        "label",
+        "children_ids",
+        "read_only",
+        "value",
+        "choices",
+    )
+
     class WidgetType(IntEnum):
         GP_WIDGET_WINDOW = 0
         GP_WIDGET_SECTION = 1
@@ -40,36 +88,57 @@ class CameraServiceConfig:
         GP_WIDGET_BUTTON = 7
         GP_WIDGET_DATE = 8
 
-    def __init__(self, widget: gp.CameraWidget):
+    # Plain dict lookup is cheaper than the IntEnum constructor for every widget
+    _TYPE_MAP = {widget_type.value: widget_type for widget_type in WidgetType}
+
+    # Widget types that carry a value; windows, sections and buttons make get_value() fail
+    _VALUE_TYPES = frozenset(
+        {
+            WidgetType.GP_WIDGET_TEXT,
+            WidgetType.GP_WIDGET_RANGE,
+            WidgetType.GP_WIDGET_TOGGLE,
+            WidgetType.GP_WIDGET_RADIO,
+            WidgetType.GP_WIDGET_MENU,
+            WidgetType.GP_WIDGET_DATE,
+        }
+    )
+
+    def __init__(
+        self,
+        widget: gp.CameraWidget,
+        parent_id: Optional[int] = None,
+        root_id: Optional[int] = None,
+        children: Optional[list[gp.CameraWidget]] = None,
+    ):
         """
         Initialize CameraConfig with metadata from a camera widget.
+        Accessors that cannot apply to the widget type are skipped rather than tried and caught.
+        A tree walk that already knows the parent, root and children passes them in to save the lookups.
         """
-        self.widget = widget
         self.id = widget.get_id()
         self.name = widget.get_name()
-        self.type = self.WidgetType(widget.get_type())
+        self.type = self._TYPE_MAP[widget.get_type()]
 
-        parent = self._default_on_except(widget.get_parent, None)
-        self.parent_id = parent.get_id() if parent else -1
+        if parent_id is not None:
+            self.parent_id = parent_id
+        elif self.type == self.WidgetType.GP_WIDGET_WINDOW:
+            # Only the top-level window has no parent
+            self.parent_id = -1
+        else:
+            self.parent_id = widget.get_parent().get_id()
 
-        root = self._default_on_except(widget.get_root, None)
-        self.root_id = root.get_id() if root else -1
+        self.root_id = root_id if root_id is not None else widget.get_root().get_id()
 
-        self.label = self._default_on_except(widget.get_label, None)
-        self.children_ids = [child.get_id() for child in self._default_on_except(widget.get_children, [])]
-        self.read_only = self._default_on_except(self.widget.get_readonly, False)
-        self.value = self._default_on_except(self.widget.get_value, None)
-        self.choices = self._get_choices(self.widget)
+        self.label = widget.get_label()
+        if children is None:
+            children = widget.get_children()
+        self.children_ids = [child.get_id() for child in children]
+        self.read_only = widget.get_readonly()
+        self.value = widget.get_value() if self.type in self._VALUE_TYPES else None
+        self.choices = self._get_choices(widget)
 
-    def _default_on_except(self, delegate, default):
-        """
-        Return the result of the delegate call or a default value on exception.
-        """
-        try:
-            return delegate()
-        except gp.GPhoto2Error as e:
-            logger.debug(f"[{self.name}] Using default for {delegate.__name__} due to: {e}")
-            return default
+        # No widget reference is kept: every field is read above, and holding it would pin
+        # the whole gphoto2 config tree for as long as the config object lives
 
     def _get_choices(self, widget):
         """
@@ -80,7 +149,7 @@ class CameraServiceConfig:
             self.WidgetType.GP_WIDGET_RADIO,
         ]:
             try:
-                return [widget.get_choice(i) for i in range(widget.count_choices())]
+                return list(map(widget.get_choice, range(widget.count_choices())))
             except gp.GPhoto2Error as e:
                 logger.warning(f"Failed to get choices for widget {self.name}: {e}")
         return []
@@ -92,10 +161,26 @@ class CameraServiceConfig:
 class CameraService:
     _lock = threading.RLock()
 
+    # Background preview producer settings (seconds)
+    PREVIEW_FRAME_INTERVAL = 1 / 30
+    PREVIEW_RETRY_DELAY = 1.0
+    PREVIEW_IDLE_TIMEOUT = 5.0
+    PREVIEW_FIRST_FRAME_TIMEOUT = 5.0
+
     def __init__(self):
         logger.debug("__init()__")
         self._camera: Optional[gp.Camera] = None
 
+        # Newest live-view frame, published by the preview thread. Guarded by
+        # _preview_lock rather than the camera lock so readers never wait on USB.
+        self._preview_lock = threading.Lock()
+        self._preview_ready = threading.Event()
+        self._preview_stop: Optional[threading.Event] = None
+        self._preview_thread: Optional[threading.Thread] = None
+        self._preview_last_request = 0.0
+        self._latest_preview: Optional[memoryview] = None
+        self._preview_error: Optional[CameraError] = None
+
     def _ensure_connected(self) -> bool:
         logger.debug("_ensure_connected()")
         if not self._camera:
@@ -126,6 +211,7 @@ class CameraService:
     def disconnect(self) -> bool:
         logger.debug("disconnect()")
         logger.info("Disconnecting from camera...")
+        self._stop_preview_thread()
         if self._camera:
             try:
                 self._camera.exit()
@@ -143,25 +229,98 @@ class CameraService:
         logger.debug("is_connected()")
         return self._camera is not None
 
-    @synchronized(_lock)
     @wrap_gphoto2_error("camera.preview")
-    def preview(self) -> bytes:
+    def preview(self) -> memoryview:
         logger.debug("preview()")
-        logger.info("Capturing camera preview...")
 
         try:
             # Fail-fast if camera is not connected
             self._ensure_connected()
 
-            # Capture preview image and convert from c-bytearray to python bytes
-            camera_file = gp.CameraFile()
-            self._camera.capture_preview(camera_file)
-            image_data = camera_file.get_data_and_size().tobytes()
-            logger.info("Preview captured successfully.")
+            # Serve the newest frame from the background producer, starting it on demand
+            self._start_preview_thread()
+            if not self._preview_ready.wait(self.PREVIEW_FIRST_FRAME_TIMEOUT):
+                raise CameraPreviewError("Timed out waiting for first preview frame")
+
+            with self._preview_lock:
+                image_data, error = self._latest_preview, self._preview_error
+            if image_data is None:
+                raise error or CameraPreviewError("No preview frame available")
             return image_data
         except CameraError as e:
             raise CameraPreviewError("Failed to capture preview", original_error=e)
 
+    def _start_preview_thread(self):
+        """
+        Start the preview producer if it is not running and mark the preview as in use.
+        """
+        with self._preview_lock:
+            self._preview_last_request = time.monotonic()
+            if self._preview_stop is not None and not self._preview_stop.is_set():
+                return
+
+            logger.info("Starting preview thread...")
+            self._latest_preview = None
+            self._preview_error = None
+            self._preview_ready.clear()
+            self._preview_stop = threading.Event()
+            self._preview_thread = threading.Thread(
+                target=self._preview_loop, args=(self._preview_stop,), name="camera-preview", daemon=True
+            )
+            self._preview_thread.start()
+
+    def _stop_preview_thread(self):
+        """
+        Signal the preview producer to exit and drop the cached frame.
+        Does not join: the thread may be waiting on the camera lock held by our caller.
+        """
+        with self._preview_lock:
+            if self._preview_stop is not None:
+                self._preview_stop.set()
+            self._preview_thread = None
+            self._latest_preview = None
+            self._preview_error = None
+            self._preview_ready.clear()
+
+    def _preview_loop(self, stop: threading.Event):
+        """
+        Continuously capture live-view frames, keeping only the newest one.
+        Exits when stopped, when the camera goes away, or after PREVIEW_IDLE_TIMEOUT without readers.
+        """
+        try:
+            while not stop.is_set():
+                with self._preview_lock:
+                    if time.monotonic() - self._preview_last_request > self.PREVIEW_IDLE_TIMEOUT:
+                        logger.info("Preview idle, stopping preview thread")
+                        stop.set()
+                        break
+
+                delay = self.PREVIEW_FRAME_INTERVAL
+                try:
+                    with self._lock:
+                        if stop.is_set() or not self._camera:
+                            break
+                        camera_file = gp.CameraFile()
+                        self._camera.capture_preview(camera_file)
+
+                    # The memoryview keeps the underlying CameraFile alive, no copy needed
+                    frame, error = memoryview(camera_file.get_data_and_size()), None
+                except gp.GPhoto2Error as e:
+                    logger.warning(f"Preview capture failed: {e}")
+                    frame, error = None, map_error(e, "capture preview")
+                    delay = self.PREVIEW_RETRY_DELAY
+
+                with self._preview_lock:
+                    if not stop.is_set():
+                        self._latest_preview, self._preview_error = frame, error
+                        self._preview_ready.set()
+
+                stop.wait(delay)
+        finally:
+            with self._preview_lock:
+                stop.set()
+            logger.info("Preview thread stopped")
+
     @synchronized(_lock)
     @wrap_gphoto2_error("camera.capture")
     def capture(self, save_to_path: str, image_name: Optional[str] = None) -> dict[str, str]:
@@ -181,11 +340,27 @@ class CameraService:
             image_path = self._camera.capture(gp.GP_CAPTURE_IMAGE)
             ext = image_path.name.split(".")[-1]  # Get file extension as provided by camera
 
-            # Transfer image from camera
-            camera_file = gp.CameraFile()
-            self._camera.file_get(image_path.folder, image_path.name, gp.GP_FILE_TYPE_NORMAL, camera_file)
+            # Transfer image from camera, streaming it straight into the destination file
+            # rather than buffering the whole RAW in memory before writing it out
             full_path = absolute_path / f"{image_name}.{ext}"
-            camera_file.save(str(full_path))
+            fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                camera_file = gp.gp_file_new_from_fd(fd)
+            except BaseException:
+                os.close(fd)
+                full_path.unlink(missing_ok=True)
+                raise
+
+            # The CameraFile now owns fd and closes it when freed; never close it here as well,
+            # another thread may already have reused the number
+            try:
+                self._camera.file_get(image_path.folder, image_path.name, gp.GP_FILE_TYPE_NORMAL, camera_file)
+            except BaseException:
+                full_path.unlink(missing_ok=True)
+                raise
+            finally:
+                # Free it now so the file is complete and closed before we report it saved
+                del camera_file
 
             logger.info(f"Image saved to {full_path}")
             return {
@@ -207,22 +382,15 @@ class CameraService:
             configs = configs or []  # Handle default
             result = {}
             root_config = self._camera.get_config()
+            widgets = _find_widgets(root_config, configs)
 
             for name in configs:
-                try:
-                    config_widget = root_config.get_child_by_name(name)
-                    if config_widget is not None:
-                        config = CameraServiceConfig(config_widget)
-                        result[name] = config
-                    else:
-                        result[name] = None
-                        logger.warning(f"Config '{name}' not found")
-                except gp.GPhoto2Error as e:
-                    if e.code == gp.GP_ERROR_BAD_PARAMETERS:
-                        result[name] = None
-                        logger.warning(f"Config '{name}' not found")
-                        continue
-                    raise e
+                config_widget = widgets.get(name)
+                if config_widget is not None:
+                    result[name] = CameraServiceConfig(config_widget)
+                else:
+                    result[name] = None
+                    logger.warning(f"Config '{name}' not found")
 
             return result
         except CameraError as e:
@@ -241,19 +409,21 @@ class CameraService:
             # Get the root configuration from the camera
             root_config = self._camera.get_config()
 
-            # Recursively traverse all configuration sections and options
-            def _extract_configs(config):
-                config_name = config.get_name()
-                results[config_name] = CameraServiceConfig(config)
-                logger.debug(results[config_name])
+            root_id = root_config.get_id()
 
-                # Recursively process child configurations
-                for i in range(config.count_children()):
-                    child_config = config.get_child(i)
-                    _extract_configs(child_config)
+            # Walk all configuration sections and options in one pass (pre-order, later duplicates win),
+            # handing each widget the parent id and children the walk already has
+            debug = logger.isEnabledFor(logging.DEBUG)
+            stack = [(root_config, -1)]
+            while stack:
+                config, parent_id = stack.pop()
+                children = [config.get_child(i) for i in range(config.count_children())]
+                camera_config = CameraServiceConfig(config, parent_id=parent_id, root_id=root_id, children=children)
+                results[camera_config.name] = camera_config
+                if debug:
+                    logger.debug("%r", camera_config)
 
-            # Start the recursive extraction from root
-            _extract_configs(root_config)
+                stack.extend((child, camera_config.id) for child in reversed(children))
 
             logger.debug(f"Retrieved {len(results)} camera configurations")
             return results
@@ -268,13 +438,9 @@ class CameraService:
             # Fail-fast if camera is not connected
             self._ensure_connected()
 
-            result = {}
             root_config = self._camera.get_config()
-            for name in configs:
-                config_widget = root_config.get_child_by_name(name)
-                result[name] = config_widget.get_value()
-
-            return result
+            widgets = _find_widgets(root_config, configs)
+            return {name: widgets[name].get_value() for name in configs if name in widgets}
         except CameraError as e:
             raise CameraError(f"Failed to get values {configs}", e)
 
@@ -287,9 +453,27 @@ class CameraService:
             self._ensure_connected()
 
             root_config = self._camera.get_config()
+            widgets = _find_widgets(root_config, (name for name, _ in configs)) if len(configs) > 1 else {}
+            changed = False
             for name, value in configs:
-                config_widget = root_config.get_child_by_name(name)
+                config_widget = widgets.get(name)
+                if config_widget is None:
+                    # Unknown names still raise the gphoto2 lookup error
+                    config_widget = root_config.get_child_by_name(name)
+
+                # Values the camera already holds need no write
+                if config_widget.get_type() in CameraServiceConfig._VALUE_TYPES and config_widget.get_value() == value:
+                    logger.debug("Config '%s' already set to %s", name, value)
+                    continue
+
                 config_widget.set_value(value)
+                changed = True
+
+            # Skip the USB round-trip when nothing changed
+            if not changed:
+                logger.info("Camera configuration unchanged")
+                return True
+
             self._camera.set_config(root_config)
 
             logger.info("Camera configuration updated")
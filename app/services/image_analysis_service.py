@@ -1,13 +1,21 @@
+import functools
+import io
 import logging
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PIL import Image
 from PIL.ExifTags import TAGS
 import cv2
 
+try:
+    import rawpy
+except ImportError:  # RAW fast path is optional; Pillow is used otherwise
+    rawpy = None
+
 from app.models.image_analysis_models import (
     ImageMetadata,
     FocusAnalysis,
@@ -20,6 +28,40 @@ from app.models.image_analysis_models import (
 
 logger = logging.getLogger(__name__)
 
+# EXIF tag name -> ImageMetadata field
+EXIF_MAPPING = {
+    "Make": "camera_make",
+    "Model": "camera_model",
+    "ISOSpeedRatings": "iso",
+    "FNumber": "aperture",
+    "ExposureTime": "exposure_time",
+    "FocalLength": "focal_length",
+    "WhiteBalance": "white_balance",
+    "Flash": "flash",
+}
+
+# Resolved once at import: EXIF tag id -> (tag name, ImageMetadata field)
+_EXIF_ID_TO_FIELD = {
+    tag_id: (tag_name, EXIF_MAPPING[tag_name]) for tag_id, tag_name in TAGS.items() if tag_name in EXIF_MAPPING
+}
+
+# Number of analysis results kept in memory, keyed by file path, mtime and size
+ANALYSIS_CACHE_SIZE = 256
+
+# Longest edge used for quick focus scoring
+QUICK_FOCUS_MAX_DIMENSION = 800
+
+# Camera RAW formats decoded through LibRaw when rawpy is installed
+RAW_EXTENSIONS = {".cr2", ".cr3", ".nef", ".arw", ".dng", ".orf", ".raf", ".rw2"}
+
+# OpenCV decode flags by downscale factor; for JPEGs libjpeg scales during the DCT
+_REDUCED_GRAYSCALE_FLAGS = {
+    8: cv2.IMREAD_REDUCED_GRAYSCALE_8,
+    4: cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    2: cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    1: cv2.IMREAD_GRAYSCALE,
+}
+
 
 class ImageAnalysisError(Exception):
     """Base exception for image analysis errors"""
@@ -27,11 +69,38 @@ class ImageAnalysisError(Exception):
     pass
 
 
+class _LuminanceStats(NamedTuple):
+    """Luminance histogram and the statistics derived from it"""
+
+    histogram: np.ndarray
+    mean: float
+    median: float
+    std: float
+    min: int
+    max: int
+
+
+class _AnalysisCore(NamedTuple):
+    """Analysis results that depend only on the image contents"""
+
+    metadata: ImageMetadata
+    focus_analysis: FocusAnalysis
+    histogram: HistogramData
+    stats: ImageStats
+    star_detection: Optional[StarDetection]
+
+
 class ImageAnalysisService:
     def __init__(self):
         self.projects_root = Path("projects")
         self.captures_root = Path("captures")
 
+        # OpenCV releases the GIL, so independent analysers of one image run in parallel
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="image-analysis")
+
+        # Pure analysis results are reused until the file's mtime or size changes
+        self._analyze_cached = functools.lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(self._analyze)
+
     def _get_image_path(self, relative_path: str) -> Path:
         """Resolve relative image path to absolute path"""
         path = Path(relative_path)
@@ -54,6 +123,9 @@ class ImageAnalysisService:
 
     def _extract_metadata(self, image_path: Path) -> ImageMetadata:
         """Extract EXIF metadata from image"""
+        if self._is_raw(image_path):
+            return self._extract_raw_metadata(image_path)
+
         try:
             with Image.open(image_path) as img:
                 # Basic image info
@@ -71,42 +143,7 @@ class ImageAnalysisService:
                 )
 
                 # Extract EXIF data if available
-                exif_data = img.getexif()
-                if exif_data:
-                    # Map EXIF tags to our model fields
-                    exif_mapping = {
-                        "Make": "camera_make",
-                        "Model": "camera_model",
-                        "ISOSpeedRatings": "iso",
-                        "FNumber": "aperture",
-                        "ExposureTime": "exposure_time",
-                        "FocalLength": "focal_length",
-                        "WhiteBalance": "white_balance",
-                        "Flash": "flash",
-                    }
-
-                    for tag_id, value in exif_data.items():
-                        tag = TAGS.get(tag_id, tag_id)
-                        if tag in exif_mapping:
-                            field_name = exif_mapping[tag]
-
-                            # Handle specific conversions
-                            if tag == "FNumber" and isinstance(value, tuple):
-                                metadata.aperture = f"f/{value[0] / value[1]:.1f}"
-                            elif tag == "ExposureTime":
-                                if isinstance(value, tuple):
-                                    exposure_val = value[0] / value[1]
-                                    metadata.exposure_time = exposure_val
-                                    if exposure_val < 1:
-                                        metadata.shutter_speed = f"1/{int(1 / exposure_val)}"
-                                    else:
-                                        metadata.shutter_speed = f"{exposure_val}s"
-                                else:
-                                    metadata.exposure_time = float(value)
-                            elif tag == "FocalLength" and isinstance(value, tuple):
-                                metadata.focal_length = f"{value[0] / value[1]:.1f}mm"
-                            else:
-                                setattr(metadata, field_name, value)
+                self._apply_exif(metadata, img.getexif())
 
                 return metadata
 
@@ -114,29 +151,108 @@ class ImageAnalysisService:
             logger.error(f"Failed to extract metadata from {image_path}: {e}")
             raise ImageAnalysisError(f"Failed to extract metadata: {str(e)}")
 
+    def _apply_exif(self, metadata: ImageMetadata, exif_data) -> None:
+        """Map EXIF tags to our model fields"""
+        for tag_id, value in exif_data.items():
+            mapped = _EXIF_ID_TO_FIELD.get(tag_id)
+            if mapped:
+                tag, field_name = mapped
+
+                # Handle specific conversions
+                if tag == "FNumber" and isinstance(value, tuple):
+                    metadata.aperture = f"f/{value[0] / value[1]:.1f}"
+                elif tag == "ExposureTime":
+                    if isinstance(value, tuple):
+                        exposure_val = value[0] / value[1]
+                        metadata.exposure_time = exposure_val
+                        if exposure_val < 1:
+                            metadata.shutter_speed = f"1/{int(1 / exposure_val)}"
+                        else:
+                            metadata.shutter_speed = f"{exposure_val}s"
+                    else:
+                        metadata.exposure_time = float(value)
+                elif tag == "FocalLength" and isinstance(value, tuple):
+                    metadata.focal_length = f"{value[0] / value[1]:.1f}mm"
+                else:
+                    setattr(metadata, field_name, value)
+
+    def _to_grayscale(self, image_array: np.ndarray) -> np.ndarray:
+        """Convert an RGB array to 8-bit luminance; grayscale input is returned as is"""
+        if len(image_array.shape) == 3:
+            return cv2.cvtColor(image_array, cv2.COLOR_RGB2GRAY)
+        return image_array
+
+    def _luminance_stats(self, gray: np.ndarray) -> _LuminanceStats:
+        """Compute the luminance histogram in one pass and derive all statistics from its 256 bins"""
+        hist = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel().astype(np.int64)
+        levels = np.arange(256)
+        total = int(hist.sum())
+
+        mean = float((levels * hist).sum() / total)
+        std = float(np.sqrt(((levels - mean) ** 2 * hist).sum() / total))
+
+        # Exact median: average of the two middle pixels in sorted order
+        cumulative = np.cumsum(hist)
+        lower, upper = np.searchsorted(cumulative, [(total - 1) // 2, total // 2], side="right")
+        median = (int(lower) + int(upper)) / 2
+
+        occupied = np.flatnonzero(hist)
+        return _LuminanceStats(
+            histogram=hist,
+            mean=mean,
+            median=median,
+            std=std,
+            min=int(occupied[0]),
+            max=int(occupied[-1]),
+        )
+
+    def _extract_raw_metadata(self, image_path: Path) -> ImageMetadata:
+        """Extract metadata from a RAW file: EXIF through Pillow, sensor size through LibRaw"""
+        try:
+            # LibRaw exposes no EXIF table; Pillow reads it from TIFF-based RAWs (CR2, NEF, ARW, DNG, ...)
+            try:
+                with Image.open(image_path) as img:
+                    exif_data = img.getexif()
+            except Exception as e:
+                logger.debug(f"No EXIF readable by Pillow in {image_path}: {e}")
+                exif_data = {}
+
+            # Pillow reports the embedded preview's size, the sensor size comes from LibRaw
+            with rawpy.imread(str(image_path)) as raw:
+                width, height = raw.sizes.width, raw.sizes.height
+
+            file_stat = image_path.stat()
+            metadata = ImageMetadata(
+                filename=image_path.name,
+                file_size_bytes=file_stat.st_size,
+                image_width=width,
+                image_height=height,
+                created_at=datetime.fromtimestamp(file_stat.st_mtime),
+            )
+            self._apply_exif(metadata, exif_data)
+            return metadata
+
+        except Exception as e:
+            logger.error(f"Failed to extract metadata from {image_path}: {e}")
+            raise ImageAnalysisError(f"Failed to extract metadata: {str(e)}")
+
     def _calculate_focus_score(self, image_array: np.ndarray) -> FocusAnalysis:
         """Calculate focus quality metrics"""
         try:
-            # Convert to grayscale if needed
-            if len(image_array.shape) == 3:
-                gray = np.dot(image_array[..., :3], [0.2989, 0.5870, 0.1140])
-            else:
-                gray = image_array
+            gray = self._to_grayscale(image_array)
 
             # Laplacian variance (primary focus metric)
-
-            laplacian = cv2.Laplacian(gray.astype(np.uint8), cv2.CV_64F)
+            laplacian = cv2.Laplacian(gray, cv2.CV_64F)
             focus_score = laplacian.var()
 
             # Additional metrics with OpenCV
-            edges = cv2.Canny(gray.astype(np.uint8), 50, 150)
-            edge_density = np.sum(edges > 0) / edges.size
+            edges = cv2.Canny(gray, 50, 150)
+            edge_density = cv2.countNonZero(edges) / edges.size
 
             # Sobel gradient magnitude
-            sobelx = cv2.Sobel(gray.astype(np.uint8), cv2.CV_64F, 1, 0, ksize=3)
-            sobely = cv2.Sobel(gray.astype(np.uint8), cv2.CV_64F, 0, 1, ksize=3)
-            sobel_magnitude = np.sqrt(sobelx**2 + sobely**2)
-            sharpness_score = np.mean(sobel_magnitude)
+            sobelx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
+            sobely = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
+            sharpness_score = cv2.mean(cv2.magnitude(sobelx, sobely))[0]
 
             return FocusAnalysis(
                 focus_score=focus_score,
@@ -150,44 +266,33 @@ class ImageAnalysisService:
             # Return default values
             return FocusAnalysis(focus_score=0.0, sharpness_score=0.0, focus_method="failed")
 
-    def _calculate_histogram(self, image_array: np.ndarray) -> HistogramData:
+    def _calculate_histogram(self, image_array: np.ndarray, luminance: _LuminanceStats) -> HistogramData:
         """Calculate image histogram and statistics"""
         try:
+            lum_hist = luminance.histogram
             if len(image_array.shape) == 3:
                 # Color image
-                red_hist = np.histogram(image_array[:, :, 0], bins=256, range=(0, 256))[0].tolist()
-                green_hist = np.histogram(image_array[:, :, 1], bins=256, range=(0, 256))[0].tolist()
-                blue_hist = np.histogram(image_array[:, :, 2], bins=256, range=(0, 256))[0].tolist()
-
-                # Calculate luminance
-                luminance = np.dot(image_array[..., :3], [0.2989, 0.5870, 0.1140])
+                red_hist, green_hist, blue_hist = (
+                    cv2.calcHist([image_array], [channel], None, [256], [0, 256]).ravel().astype(np.int64).tolist()
+                    for channel in range(3)
+                )
             else:
                 # Grayscale image
-                gray_hist = np.histogram(image_array, bins=256, range=(0, 256))[0].tolist()
-                red_hist = green_hist = blue_hist = gray_hist
-                luminance = image_array
-
-            # Luminance histogram
-            lum_hist = np.histogram(luminance, bins=256, range=(0, 256))[0].tolist()
-
-            # Statistics
-            mean_brightness = np.mean(luminance)
-            median_brightness = np.median(luminance)
-            std_brightness = np.std(luminance)
+                red_hist = green_hist = blue_hist = lum_hist.tolist()
 
             # Clipping analysis
-            total_pixels = luminance.size
-            clipped_highlights = np.sum(luminance >= 250) / total_pixels * 100
-            clipped_shadows = np.sum(luminance <= 5) / total_pixels * 100
+            total_pixels = int(lum_hist.sum())
+            clipped_highlights = lum_hist[250:].sum() / total_pixels * 100
+            clipped_shadows = lum_hist[:6].sum() / total_pixels * 100
 
             return HistogramData(
                 red_histogram=red_hist,
                 green_histogram=green_hist,
                 blue_histogram=blue_hist,
-                luminance_histogram=lum_hist,
-                mean_brightness=float(mean_brightness),
-                median_brightness=float(median_brightness),
-                std_brightness=float(std_brightness),
+                luminance_histogram=lum_hist.tolist(),
+                mean_brightness=luminance.mean,
+                median_brightness=luminance.median,
+                std_brightness=luminance.std,
                 clipped_highlights=float(clipped_highlights),
                 clipped_shadows=float(clipped_shadows),
             )
@@ -196,22 +301,16 @@ class ImageAnalysisService:
             logger.error(f"Failed to calculate histogram: {e}")
             raise ImageAnalysisError(f"Failed to calculate histogram: {str(e)}")
 
-    def _calculate_stats(self, image_array: np.ndarray) -> ImageStats:
+    def _calculate_stats(self, luminance: _LuminanceStats) -> ImageStats:
         """Calculate basic image statistics"""
         try:
-            # Convert to grayscale for statistics
-            if len(image_array.shape) == 3:
-                gray = np.dot(image_array[..., :3], [0.2989, 0.5870, 0.1140])
-            else:
-                gray = image_array
-
             return ImageStats(
-                mean_value=float(np.mean(gray)),
-                median_value=float(np.median(gray)),
-                std_deviation=float(np.std(gray)),
-                min_value=int(np.min(gray)),
-                max_value=int(np.max(gray)),
-                dynamic_range=float(np.max(gray) - np.min(gray)),
+                mean_value=luminance.mean,
+                median_value=luminance.median,
+                std_deviation=luminance.std,
+                min_value=luminance.min,
+                max_value=luminance.max,
+                dynamic_range=float(luminance.max - luminance.min),
             )
 
         except Exception as e:
@@ -219,14 +318,8 @@ class ImageAnalysisService:
             raise ImageAnalysisError(f"Failed to calculate stats: {str(e)}")
 
     def _detect_stars(self, image_array: np.ndarray) -> Optional[StarDetection]:
-        """Detect stars in the image (requires OpenCV)"""
-        if not self._cv2_available:
-            logger.warning("Star detection requires OpenCV")
-            return None
-
+        """Detect stars in the image"""
         try:
-            import cv2
-
             # Convert to grayscale
             if len(image_array.shape) == 3:
                 gray = cv2.cvtColor(image_array, cv2.COLOR_RGB2GRAY)
@@ -236,32 +329,33 @@ class ImageAnalysisService:
             # Apply Gaussian blur to reduce noise
             blurred = cv2.GaussianBlur(gray, (5, 5), 0)
 
-            # Threshold to find bright spots (stars)
-            _, thresh = cv2.threshold(blurred, 0.7 * np.max(blurred), 255, cv2.THRESH_BINARY)
-
-            # Find contours (star candidates)
-            contours, _ = cv2.findContours(thresh.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-
-            stars = []
-            brightness_values = []
-
-            for contour in contours:
-                # Filter by area (remove noise and large objects)
-                area = cv2.contourArea(contour)
-                if 3 <= area <= 500:  # Reasonable star size range
-                    # Get centroid
-                    M = cv2.moments(contour)
-                    if M["m00"] != 0:
-                        cx = M["m10"] / M["m00"]
-                        cy = M["m01"] / M["m00"]
-
-                        # Get brightness at star center
-                        x, y = int(cx), int(cy)
-                        if 0 <= x < gray.shape[1] and 0 <= y < gray.shape[0]:
-                            brightness = float(gray[y, x])
-                            brightness_values.append(brightness)
-
-                            stars.append({"x": float(cx), "y": float(cy), "brightness": brightness})
+            # Bright spots above 70% of the peak, sized like stars; a single threshold level
+            # so the detector's area filter and centroids replace the per-contour Python loop
+            threshold = 0.7 * float(np.max(blurred))
+            params = cv2.SimpleBlobDetector_Params()
+            params.minThreshold = threshold
+            params.maxThreshold = threshold + 1
+            params.thresholdStep = 1
+            params.minRepeatability = 1
+            params.minDistBetweenBlobs = 1
+            params.filterByColor = True
+            params.blobColor = 255
+            params.filterByArea = True
+            params.minArea = 3
+            params.maxArea = 500
+            params.filterByCircularity = False
+            params.filterByInertia = False
+            params.filterByConvexity = False
+
+            keypoints = cv2.SimpleBlobDetector_create(params).detect(blurred)
+
+            height, width = gray.shape[:2]
+            stars = [
+                {"x": float(kp.pt[0]), "y": float(kp.pt[1]), "brightness": float(gray[int(kp.pt[1]), int(kp.pt[0])])}
+                for kp in keypoints
+                if 0 <= int(kp.pt[0]) < width and 0 <= int(kp.pt[1]) < height
+            ]
+            brightness_values = [star["brightness"] for star in stars]
 
             return StarDetection(
                 star_count=len(stars),
@@ -285,12 +379,18 @@ class ImageAnalysisService:
             # Generate thumbnail
             with Image.open(image_path) as img:
                 # Convert to RGB if needed
-                if img.mode in ("RGBA", "LA", "P"):
+                if img.mode not in ("RGB", "L"):
                     img = img.convert("RGB")
 
                 # Create thumbnail
                 img.thumbnail((thumbnail_size, thumbnail_size), Image.Resampling.LANCZOS)
-                img.save(thumb_path, "JPEG", quality=85, optimize=True)
+                thumb_array = np.asarray(img)
+
+            # Encode with OpenCV's libjpeg-turbo (SIMD DCT, single-pass Huffman)
+            if thumb_array.ndim == 3:
+                thumb_array = cv2.cvtColor(thumb_array, cv2.COLOR_RGB2BGR)
+            if not cv2.imwrite(str(thumb_path), thumb_array, [cv2.IMWRITE_JPEG_QUALITY, 85]):
+                raise ImageAnalysisError(f"Failed to write thumbnail {thumb_path}")
 
             # Return relative path from projects root
             return str(thumb_path.relative_to(self.projects_root))
@@ -303,34 +403,15 @@ class ImageAnalysisService:
         self, image_path: str, generate_thumbnail: bool = True, detect_stars: bool = False, thumbnail_size: int = 400
     ) -> ImageAnalysisResult:
         """Perform complete image analysis"""
-        start_time = time.time()
-
         try:
+            start_time = time.time()
+
             # Resolve image path
             full_path = self._get_image_path(image_path)
-            logger.info(f"Analyzing image: {full_path}")
+            file_stat = full_path.stat()
+            core = self._analyze_cached(str(full_path), file_stat.st_mtime_ns, file_stat.st_size, detect_stars)
 
-            # Load image
-            with Image.open(full_path) as img:
-                # Convert to RGB array
-                if img.mode != "RGB":
-                    img = img.convert("RGB")
-                image_array = np.array(img)
-
-            # Extract metadata
-            metadata = self._extract_metadata(full_path)
-
-            # Perform analysis
-            focus_analysis = self._calculate_focus_score(image_array)
-            histogram = self._calculate_histogram(image_array)
-            stats = self._calculate_stats(image_array)
-
-            # Optional star detection
-            star_detection = None
-            if detect_stars:
-                star_detection = self._detect_stars(image_array)
-
-            # Optional thumbnail generation
+            # Optional thumbnail generation, a file side effect kept out of the cache
             thumbnail_path = None
             thumbnail_generated = False
             if generate_thumbnail:
@@ -343,36 +424,122 @@ class ImageAnalysisService:
             result = ImageAnalysisResult(
                 filename=full_path.name,
                 analyzed_at=datetime.now(),
-                metadata=metadata,
-                focus_analysis=focus_analysis,
-                histogram=histogram,
-                stats=stats,
-                star_detection=star_detection,
+                metadata=core.metadata,
+                focus_analysis=core.focus_analysis,
+                histogram=core.histogram,
+                stats=core.stats,
+                star_detection=core.star_detection,
                 analysis_duration_ms=analysis_duration,
                 thumbnail_generated=thumbnail_generated,
                 thumbnail_path=thumbnail_path,
             )
 
-            logger.info(f"Analysis completed in {analysis_duration:.1f}ms - Focus: {focus_analysis.focus_score:.1f}")
+            logger.info(
+                f"Analysis completed in {analysis_duration:.1f}ms - Focus: {core.focus_analysis.focus_score:.1f}"
+            )
             return result
 
         except Exception as e:
             logger.error(f"Failed to analyze image {image_path}: {e}")
             raise ImageAnalysisError(f"Failed to analyze image: {str(e)}")
 
+    def _analyze(
+        self,
+        path_str: str,
+        mtime_ns: int,
+        size: int,
+        detect_stars: bool,
+    ) -> _AnalysisCore:
+        """Analyze a resolved image; mtime_ns and size only serve as cache key"""
+        full_path = Path(path_str)
+        logger.info(f"Analyzing image: {full_path}")
+
+        # Load image
+        image_array = self._load_image_array(full_path)
+
+        # Extract metadata
+        metadata = self._extract_metadata(full_path)
+
+        # Perform analysis; luminance is converted once and shared. Focus scoring and
+        # star detection run on the pool while histogram and stats are computed here.
+        gray = self._to_grayscale(image_array)
+        focus_future = self._executor.submit(self._calculate_focus_score, gray)
+        stars_future = self._executor.submit(self._detect_stars, gray) if detect_stars else None
+
+        luminance = self._luminance_stats(gray)
+        histogram = self._calculate_histogram(image_array, luminance)
+        stats = self._calculate_stats(luminance)
+
+        focus_analysis = focus_future.result()
+        star_detection = stars_future.result() if stars_future else None
+
+        return _AnalysisCore(metadata, focus_analysis, histogram, stats, star_detection)
+
+    def _is_raw(self, image_path: Path) -> bool:
+        """Whether the file is a camera RAW that can take the LibRaw fast path"""
+        return rawpy is not None and image_path.suffix.lower() in RAW_EXTENSIONS
+
+    def _load_image_array(self, image_path: Path) -> np.ndarray:
+        """Load an image as an 8-bit RGB array"""
+        if self._is_raw(image_path):
+            # Half-size demosaic: 2x2 binning skips interpolation and matches the analysis resolution
+            with rawpy.imread(str(image_path)) as raw:
+                return raw.postprocess(half_size=True, use_camera_wb=True, output_bps=8)
+
+        with Image.open(image_path) as img:
+            # Convert to RGB array
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+            return np.array(img)
+
+    def _reduced_grayscale_flag(self, longest: int, max_dimension: int) -> int:
+        """Pick the largest decode-time reduction that keeps at least max_dimension pixels"""
+        factor = next(f for f in _REDUCED_GRAYSCALE_FLAGS if f == 1 or longest // f >= max_dimension)
+        return _REDUCED_GRAYSCALE_FLAGS[factor]
+
+    def _load_raw_preview_grayscale(self, image_path: Path, max_dimension: int) -> np.ndarray:
+        """Decode the embedded preview of a RAW file, demosaicing at half size only if there is none"""
+        with rawpy.imread(str(image_path)) as raw:
+            try:
+                thumb = raw.extract_thumb()
+            except rawpy.LibRawError:
+                thumb = None
+
+            if thumb is not None and thumb.format == rawpy.ThumbFormat.JPEG:
+                with Image.open(io.BytesIO(thumb.data)) as img:
+                    longest = max(img.size)
+                flag = self._reduced_grayscale_flag(longest, max_dimension)
+                return cv2.imdecode(np.frombuffer(thumb.data, dtype=np.uint8), flag)
+            if thumb is not None:
+                return cv2.cvtColor(thumb.data, cv2.COLOR_RGB2GRAY)
+
+            rgb = raw.postprocess(half_size=True, use_camera_wb=True, output_bps=8)
+            return cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+
+    def _load_reduced_grayscale(self, image_path: Path, max_dimension: int) -> np.ndarray:
+        """Decode a grayscale image scaled so its longest edge is at most max_dimension"""
+        if self._is_raw(image_path):
+            gray = self._load_raw_preview_grayscale(image_path, max_dimension)
+        else:
+            # Only the header is read here, to pick the largest decode-time reduction
+            with Image.open(image_path) as img:
+                longest = max(img.size)
+            gray = cv2.imread(str(image_path), self._reduced_grayscale_flag(longest, max_dimension))
+
+        if gray is None:
+            raise ImageAnalysisError(f"OpenCV cannot decode {image_path.name}")
+
+        scale = max_dimension / max(gray.shape[:2])
+        if scale < 1:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        return gray
+
     def quick_focus_score(self, image_path: str) -> float:
         """Quick focus score calculation without full analysis"""
         try:
             full_path = self._get_image_path(image_path)
 
-            # Load smaller version for speed
-            with Image.open(full_path) as img:
-                # Resize to 800px max dimension for speed
-                img.thumbnail((800, 800))
-                if img.mode != "RGB":
-                    img = img.convert("RGB")
-                image_array = np.array(img)
-
+            image_array = self._load_reduced_grayscale(full_path, QUICK_FOCUS_MAX_DIMENSION)
             focus_analysis = self._calculate_focus_score(image_array)
             return focus_analysis.focus_score
 
@@ -1,11 +1,22 @@
-import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Concurrent file reads when the preset listing has to be rebuilt
+PRESET_READ_WORKERS = 8
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
 
 class PresetServiceError(Exception):
     """Base exception for preset-related errors"""
@@ -24,6 +35,10 @@ class PresetService:
         self.presets_dir = Path(presets_root)
         self.presets_dir.mkdir(parents=True, exist_ok=True)
 
+        # Parsed presets keyed on the directory mtime, dropped whenever we write or delete
+        self._list_cache: Optional[tuple[int, List[dict]]] = None
+        self._executor = ThreadPoolExecutor(max_workers=PRESET_READ_WORKERS, thread_name_prefix="preset-read")
+
     def save_preset(self, name: str, label: str, configs: Dict[str, str], description: Optional[str] = None) -> dict:
         """Save camera configurations as a preset"""
         try:
@@ -39,10 +54,14 @@ class PresetService:
                 "configs": configs,
             }
 
-            # Save to file
+            # Save to file, written aside and renamed so readers never see a partial preset
             preset_file = self.presets_dir / f"{name}.json"
-            with open(preset_file, "w") as f:
-                json.dump(preset_data, f, indent=2)
+            tmp_file = preset_file.with_name(f"{preset_file.name}.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(preset_data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, preset_file)
+            # Two saves within one mtime tick (coarse on some filesystems) would leave the dir mtime equal
+            self._list_cache = None
 
             logger.info(f"Saved preset '{name}' with {len(configs)} configurations")
             return preset_data
@@ -54,19 +73,27 @@ class PresetService:
     def list_presets(self) -> List[dict]:
         """List all available presets"""
         try:
+            mtime_ns = self.presets_dir.stat().st_mtime_ns
+            if self._list_cache and self._list_cache[0] == mtime_ns:
+                return list(self._list_cache[1])
+
             presets = []
 
-            for preset_file in self.presets_dir.glob("*.json"):
+            with os.scandir(self.presets_dir) as entries:
+                preset_files = [(entry.name, entry.path) for entry in entries if entry.name.endswith(".json")]
+
+            # Reads overlap on the pool (file I/O releases the GIL), decoding stays on this thread
+            reads = [(file_name, self._executor.submit(_read_file, path)) for file_name, path in preset_files]
+            for file_name, read in reads:
                 try:
-                    with open(preset_file, "r") as f:
-                        preset_data = json.load(f)
-                    presets.append(preset_data)
+                    presets.append(orjson.loads(read.result()))
                 except Exception as e:
-                    logger.warning(f"Failed to load preset {preset_file.name}: {e}")
+                    logger.warning(f"Failed to load preset {file_name}: {e}")
 
             # Sort by creation date, newest first
             presets.sort(key=lambda p: p.get("created_at", ""), reverse=True)
-            return presets
+            self._list_cache = (mtime_ns, presets)
+            return list(presets)
 
         except Exception as e:
             logger.error(f"Failed to list presets: {e}")
@@ -77,12 +104,12 @@ class PresetService:
         try:
             preset_file = self.presets_dir / f"{name}.json"
 
-            if not preset_file.exists():
+            try:
+                with open(preset_file, "rb") as f:
+                    return orjson.loads(f.read())
+            except FileNotFoundError:
                 raise PresetNotFoundError(f"Preset '{name}' not found")
 
-            with open(preset_file, "r") as f:
-                return json.load(f)
-
         except PresetNotFoundError:
             raise
         except Exception as e:
@@ -94,10 +121,11 @@ class PresetService:
         try:
             preset_file = self.presets_dir / f"{name}.json"
 
-            if not preset_file.exists():
+            try:
+                preset_file.unlink()
+            except FileNotFoundError:
                 raise PresetNotFoundError(f"Preset '{name}' not found")
-
-            preset_file.unlink()
+            self._list_cache = None
             logger.info(f"Deleted preset '{name}'")
             return True
 
@@ -1,19 +1,93 @@
-import json
+import atexit
+import functools
 import logging
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
+
+import orjson
+
 from app.models.session_models import (
     Session,
     SessionStatus,
     SessionImage,
+    SessionStatistics,
+    SessionSummary,
+    CameraCaptureSettings,
     CapturePlan,
+    PERSIST_CONTEXT,
 )
 
 
 logger = logging.getLogger(__name__)
 
 
+# Bounds how many sessions keep precomputed paths
+SESSION_PATHS_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=SESSION_PATHS_CACHE_SIZE)
+def _session_paths(projects_root: Path, session_id: str) -> SimpleNamespace:
+    """Build the directory and file paths of a session once"""
+    root = projects_root / session_id
+    return SimpleNamespace(
+        root=root,
+        session_json=root / "session.json",
+        meta_json=root / "meta.json",
+        captures=root / "captures",
+        previews=root / "previews",
+        analysis=root / "analysis",
+    )
+
+
+def _file_version(st: os.stat_result) -> tuple[int, int, int]:
+    """Identify one version of a file; os.replace gives every write a new inode, even within one mtime tick"""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def _fast_construct(data: dict) -> Session:
+    """
+    Build a Session from session.json data written by this service, skipping Pydantic validation.
+    Falls back to full validation for data this shortcut cannot handle, e.g. files saved
+    before the running focus score totals existed.
+    """
+    try:
+        statistics = data.get("statistics")
+        if statistics is None or statistics.get("focus_score_count") is None:
+            return Session(**data)
+
+        camera_settings = data.get("camera_settings")
+        if camera_settings is not None:
+            camera_settings = CameraCaptureSettings.model_construct(
+                **{**camera_settings, "captured_at": _parse_datetime(camera_settings.get("captured_at"))}
+            )
+
+        return Session.model_construct(
+            **{
+                **data,
+                "created_at": datetime.fromisoformat(data["created_at"]),
+                "updated_at": datetime.fromisoformat(data["updated_at"]),
+                "status": SessionStatus(data.get("status", SessionStatus.ACTIVE)),
+                "camera_settings": camera_settings,
+                "capture_plan": CapturePlan.model_construct(**data.get("capture_plan", {})),
+                "statistics": SessionStatistics.model_construct(**statistics),
+                "images": [
+                    SessionImage.model_construct(**{**image, "captured_at": datetime.fromisoformat(image["captured_at"])})
+                    for image in data.get("images", [])
+                ],
+            }
+        )
+    except (KeyError, TypeError, ValueError):
+        return Session(**data)
+
+
 class SessionError(Exception):
     """Base exception for session-related errors"""
 
@@ -27,97 +101,205 @@ class SessionNotFoundError(SessionError):
 
 
 class SessionService:
+    # Delay before pending session changes are written to disk (seconds)
+    SAVE_DEBOUNCE_SECONDS = 1.0
+
     def __init__(self, projects_root: str = "projects"):
         self.projects_root = Path(projects_root)
         self.projects_root.mkdir(exist_ok=True)
         self._active_session_id: Optional[str] = None
 
+        # Parsed sessions keyed by id as (file version, session, validated), valid while session.json
+        # keeps the same inode, mtime and size. Unvalidated entries come from _fast_construct.
+        self._session_cache: dict[str, tuple[tuple[int, int, int], Session, bool]] = {}
+
+        # Cached sessions with changes not yet written, flushed by a debounce timer
+        self._save_lock = threading.RLock()
+        self._dirty_sessions: set[str] = set()
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
+
         # Try to restore active session from state file
         self._load_active_session_state()
 
     def _load_active_session_state(self):
         """Load the active session from persistent state"""
         state_file = self.projects_root / ".active_session"
-        if state_file.exists():
-            try:
-                self._active_session_id = state_file.read_text().strip()
-                # Verify the session still exists
-                if not self._session_exists(self._active_session_id):
-                    logger.warning(f"Active session {self._active_session_id} no longer exists, clearing")
-                    self._active_session_id = None
-                    state_file.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to load active session state: {e}")
+        try:
+            self._active_session_id = state_file.read_text().strip()
+            # Verify the session still exists
+            if not self._session_exists(self._active_session_id):
+                logger.warning(f"Active session {self._active_session_id} no longer exists, clearing")
                 self._active_session_id = None
+                state_file.unlink()
+        except FileNotFoundError:
+            self._active_session_id = None
+        except Exception as e:
+            logger.warning(f"Failed to load active session state: {e}")
+            self._active_session_id = None
 
     def _save_active_session_state(self):
         """Save the active session to persistent state"""
         state_file = self.projects_root / ".active_session"
         if self._active_session_id:
-            state_file.write_text(self._active_session_id)
-        elif state_file.exists():
-            state_file.unlink()
+            self._replace_file(state_file, self._active_session_id.encode())
+        else:
+            state_file.unlink(missing_ok=True)
 
-    def _generate_session_id(self, target: str) -> str:
+    def _generate_session_id(self, target: str, now: Optional[datetime] = None) -> str:
         """Generate a unique session ID based on target and date"""
-        date_str = datetime.now().strftime("%Y%m%d")
+        date_str = (now or datetime.now()).strftime("%Y%m%d")
         base_id = f"{target.lower()}_{date_str}"
 
-        # Find next available sequence number
+        # Find next available sequence number from a single directory listing
+        prefix = f"{base_id}_"
+        with os.scandir(self.projects_root) as entries:
+            existing = {entry.name for entry in entries if entry.name.startswith(prefix)}
+
         sequence = 1
-        while self._session_exists(f"{base_id}_{sequence:03d}"):
+        while f"{base_id}_{sequence:03d}" in existing:
             sequence += 1
 
         return f"{base_id}_{sequence:03d}"
 
     def _session_exists(self, session_id: str) -> bool:
         """Check if a session directory exists"""
-        return (self.projects_root / session_id).exists()
+        return self._get_session_path(session_id).exists()
 
     def _get_session_path(self, session_id: str) -> Path:
         """Get the full path to a session directory"""
-        return self.projects_root / session_id
+        return _session_paths(self.projects_root, session_id).root
 
     def _get_session_file(self, session_id: str) -> Path:
         """Get the path to the session.json file"""
-        return self._get_session_path(session_id) / "session.json"
+        return _session_paths(self.projects_root, session_id).session_json
+
+    def _get_meta_file(self, session_id: str) -> Path:
+        """Get the path to the meta.json summary sidecar"""
+        return _session_paths(self.projects_root, session_id).meta_json
 
     def _create_session_directories(self, session_id: str):
         """Create the session directory structure"""
-        session_path = self._get_session_path(session_id)
-        session_path.mkdir(exist_ok=True)
-        (session_path / "captures").mkdir(exist_ok=True)
-        (session_path / "previews").mkdir(exist_ok=True)
-        (session_path / "analysis").mkdir(exist_ok=True)
-
-    def _save_session(self, session: Session):
-        """Save session metadata to disk"""
+        paths = _session_paths(self.projects_root, session_id)
+        paths.root.mkdir(exist_ok=True)
+        paths.captures.mkdir(exist_ok=True)
+        paths.previews.mkdir(exist_ok=True)
+        paths.analysis.mkdir(exist_ok=True)
+
+    def _replace_file(self, path: Path, content: bytes):
+        """Atomically replace a file with the given content"""
+        tmp_file = path.with_name(f"{path.name}.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(content)
+        os.replace(tmp_file, path)
+
+    def _write_session_file(self, session: Session):
+        """Atomically replace session.json and its meta.json summary with the given session"""
         session_file = self._get_session_file(session.id)
-        session.update_timestamp()
 
-        with open(session_file, "w") as f:
-            json.dump(session.model_dump(mode="json"), f, indent=2, default=str)
+        # Serialized straight to JSON by pydantic-core, no intermediate dict
+        self._replace_file(session_file, session.model_dump_json(indent=2, context=PERSIST_CONTEXT).encode())
+        self._session_cache[session.id] = (_file_version(session_file.stat()), session, True)
+
+        # Listing reads only this header, so it never has to parse the image list
+        self._replace_file(
+            self._get_meta_file(session.id), session.model_dump_json(indent=2, exclude={"images"}).encode()
+        )
 
         logger.debug(f"Session {session.id} saved to {session_file}")
 
-    def _load_session(self, session_id: str) -> Session:
-        """Load session metadata from disk"""
+    def _save_session(self, session: Session, now: Optional[datetime] = None):
+        """Save session metadata to disk"""
+        with self._save_lock:
+            session.update_timestamp(now)
+            self._dirty_sessions.discard(session.id)
+            try:
+                self._write_session_file(session)
+            except Exception:
+                self._session_cache.pop(session.id, None)
+                raise
+
+    def _schedule_save(self, session: Session, now: Optional[datetime] = None):
+        """Mark a cached session as changed; it is written on the next flush"""
+        with self._save_lock:
+            session.update_timestamp(now)
+            self._dirty_sessions.add(session.id)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.SAVE_DEBOUNCE_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Write all sessions with pending changes to disk"""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            dirty, self._dirty_sessions = self._dirty_sessions, set()
+            failed = []
+            for session_id in dirty:
+                cached = self._session_cache.get(session_id)
+                if cached is None:
+                    continue
+                try:
+                    self._write_session_file(cached[1])
+                except Exception as e:
+                    logger.error(f"Failed to save session {session_id}: {e}")
+                    failed.append(cached[1])
+
+            # Keep failed sessions pending so their changes are retried rather than lost
+            for session in failed:
+                self._schedule_save(session)
+
+    def _load_session(self, session_id: str, validate: bool = True) -> Session:
+        """
+        Load session metadata from disk, optionally trusting it and skipping validation.
+        Returns the cached instance that the debounced flusher also writes: mutate it only while
+        holding _save_lock, and never hand it out directly (public getters return copies).
+        """
         session_file = self._get_session_file(session_id)
 
-        if not session_file.exists():
+        try:
+            version = _file_version(session_file.stat())
+        except FileNotFoundError:
+            self._session_cache.pop(session_id, None)
             raise SessionNotFoundError(f"Session {session_id} not found")
 
+        # Skip the parse when session.json has not changed since we last read or wrote it,
+        # or when the cached copy holds changes that are not flushed yet
+        cached = self._session_cache.get(session_id)
+        if cached and (cached[0] == version or session_id in self._dirty_sessions):
+            cached_version, session, validated = cached
+            if validated or not validate:
+                return session
+
+            # Built by _fast_construct; validate it before handing it to a caller that relies on it
+            try:
+                session = Session.model_validate(session.model_dump(warnings=False, context=PERSIST_CONTEXT))
+            except Exception as e:
+                self._session_cache.pop(session_id, None)
+                raise SessionError(f"Failed to load session {session_id}: {e}")
+
+            self._session_cache[session_id] = (cached_version, session, True)
+            return session
+
         try:
-            with open(session_file, "r") as f:
-                data = json.load(f)
-            return Session(**data)
+            with open(session_file, "rb") as f:
+                data = orjson.loads(f.read())
+            session = Session(**data) if validate else _fast_construct(data)
         except Exception as e:
+            self._session_cache.pop(session_id, None)
             raise SessionError(f"Failed to load session {session_id}: {e}")
 
+        self._session_cache[session_id] = (version, session, validate)
+        return session
+
     def create_session(self, name: str, target: str, capture_plan: Optional[CapturePlan] = None) -> Session:
         """Create a new session"""
-        session_id = self._generate_session_id(target)
+        # One clock read shared by the id, the timestamps and the save
         now = datetime.now()
+        session_id = self._generate_session_id(target, now)
 
         session = Session(
             id=session_id,
@@ -132,26 +314,44 @@ class SessionService:
         self._create_session_directories(session_id)
 
         # Save session metadata
-        self._save_session(session)
+        self._save_session(session, now)
 
         logger.info(f"Created new session: {session_id}")
-        return session
+        return session.model_copy(deep=True)
 
     def get_session(self, session_id: str) -> Session:
         """Get a session by ID"""
-        return self._load_session(session_id)
+        with self._save_lock:
+            return self._load_session(session_id).model_copy(deep=True)
 
-    def list_sessions(self) -> list[Session]:
+    def _load_session_summary(self, session_id: str) -> SessionSummary:
+        """Load a session summary from meta.json, falling back to the full session"""
+        with self._save_lock:
+            cached = self._session_cache.get(session_id)
+            if cached and session_id in self._dirty_sessions:
+                return SessionSummary.from_session(cached[1].model_copy(deep=True))
+
+        try:
+            with open(self._get_meta_file(session_id), "rb") as f:
+                return SessionSummary(**orjson.loads(f.read()))
+        except FileNotFoundError:
+            # Sessions saved before meta.json existed
+            with self._save_lock:
+                return SessionSummary.from_session(self._load_session(session_id, validate=False).model_copy(deep=True))
+
+    def list_sessions(self) -> list[SessionSummary]:
         """List all sessions, sorted by creation date (newest first)"""
         sessions = []
 
-        for session_dir in self.projects_root.iterdir():
-            if session_dir.is_dir() and not session_dir.name.startswith("."):
+        # scandir reports the entry type from the directory read, no extra stat per entry
+        with os.scandir(self.projects_root) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_dir(follow_symlinks=False):
+                    continue
                 try:
-                    session = self._load_session(session_dir.name)
-                    sessions.append(session)
+                    sessions.append(self._load_session_summary(entry.name))
                 except Exception as e:
-                    logger.warning(f"Failed to load session {session_dir.name}: {e}")
+                    logger.warning(f"Failed to load session {entry.name}: {e}")
 
         # Sort by creation date, newest first
         sessions.sort(key=lambda s: s.created_at, reverse=True)
@@ -165,40 +365,47 @@ class SessionService:
         capture_plan: Optional[CapturePlan] = None,
     ) -> Session:
         """Update session metadata"""
-        session = self._load_session(session_id)
+        with self._save_lock:
+            session = self._load_session(session_id)
 
-        if name is not None:
-            session.name = name
-        if status is not None:
-            session.status = status
-        if capture_plan is not None:
-            session.capture_plan = capture_plan
+            if name is not None:
+                session.name = name
+            if status is not None:
+                session.status = status
+            if capture_plan is not None:
+                session.capture_plan = capture_plan
+
+            self._save_session(session)
+            session = session.model_copy(deep=True)
 
-        self._save_session(session)
         logger.info(f"Updated session {session_id}")
         return session
 
     def delete_session(self, session_id: str) -> bool:
         """Delete a session and all its data"""
-        if not self._session_exists(session_id):
-            raise SessionNotFoundError(f"Session {session_id} not found")
-
-        # Clear active session if deleting it
-        if self._active_session_id == session_id:
-            self.set_active_session(None)
-
         # Remove directory and all contents
         import shutil
 
         session_path = self._get_session_path(session_id)
-        shutil.rmtree(session_path)
+        with self._save_lock:
+            self._dirty_sessions.discard(session_id)
+            self._session_cache.pop(session_id, None)
+            try:
+                shutil.rmtree(session_path)
+            except FileNotFoundError:
+                raise SessionNotFoundError(f"Session {session_id} not found")
+
+        # Clear active session if deleting it
+        if self._active_session_id == session_id:
+            self.set_active_session(None)
 
         logger.info(f"Deleted session {session_id}")
         return True
 
     def set_active_session(self, session_id: Optional[str]):
         """Set the active session for captures"""
-        if session_id and not self._session_exists(session_id):
+        # Sessions we have loaded or written are known to exist, anything else needs one stat
+        if session_id and session_id not in self._session_cache and not self._get_session_file(session_id).is_file():
             raise SessionNotFoundError(f"Session {session_id} not found")
 
         self._active_session_id = session_id
@@ -214,7 +421,8 @@ class SessionService:
         if not self._active_session_id:
             return None
         try:
-            return self._load_session(self._active_session_id)
+            with self._save_lock:
+                return self._load_session(self._active_session_id, validate=False).model_copy(deep=True)
         except SessionNotFoundError:
             # Clear invalid active session
             self.set_active_session(None)
@@ -224,36 +432,55 @@ class SessionService:
         self, session_id: str, filename: str, size_bytes: Optional[int] = None, focus_score: Optional[float] = None
     ) -> Session:
         """Add an image to a session and update statistics"""
-        session = self._load_session(session_id)
-
-        # Create image entry
-        image = SessionImage(
-            filename=filename,
-            captured_at=datetime.now(),
-            size_bytes=size_bytes,
-            focus_score=focus_score,
-            preview_path=f"previews/{Path(filename).stem}_thumb.jpg",
-        )
+        with self._save_lock:
+            session = self._load_session(session_id)
+            now = datetime.now()
+
+            # Create image entry
+            image = SessionImage(
+                filename=filename,
+                captured_at=now,
+                size_bytes=size_bytes,
+                focus_score=focus_score,
+                preview_path=f"previews/{os.path.splitext(os.path.basename(filename))[0]}_thumb.jpg",
+            )
 
-        session.images.append(image)
+            session.images.append(image)
 
-        # Update statistics
-        session.statistics.total_captures += 1
-        session.statistics.successful_captures += 1
+            # Update statistics
+            session.statistics.total_captures += 1
+            session.statistics.successful_captures += 1
 
-        # Update average focus score if available
-        focus_scores = [img.focus_score for img in session.images if img.focus_score is not None]
-        if focus_scores:
-            session.statistics.average_focus_score = sum(focus_scores) / len(focus_scores)
+            # Update average focus score if available
+            if focus_score is not None:
+                session.statistics.add_focus_score(focus_score)
+
+            # Written by the debounced flusher, bursts of captures share one rewrite
+            self._schedule_save(session, now)
+            session = session.model_copy(deep=True)
 
-        self._save_session(session)
         logger.info(f"Added image {filename} to session {session_id}")
         return session
 
+    def clear_focus_scores(self, session_id: str) -> Session:
+        """Drop the focus scores of all images in a session"""
+        with self._save_lock:
+            session = self._load_session(session_id)
+
+            for image in session.images:
+                image.focus_score = None
+            session.statistics.reset_focus_scores()
+
+            self._save_session(session)
+            session = session.model_copy(deep=True)
+
+        logger.info(f"Cleared focus scores for session {session_id}")
+        return session
+
     def get_session_captures_path(self, session_id: str) -> Path:
         """Get the captures directory path for a session"""
-        return self._get_session_path(session_id) / "captures"
+        return _session_paths(self.projects_root, session_id).captures
 
     def get_session_previews_path(self, session_id: str) -> Path:
         """Get the previews directory path for a session"""
-        return self._get_session_path(session_id) / "previews"
+        return _session_paths(self.projects_root, session_id).previews
@@ -1,8 +1,60 @@
+import functools
 import inspect
+import io
+import reprlib
 import sys
+import types
 from typing import Any
 
 
+_MISSING = object()
+
+# Exact types dumped by value / with sample items (subclasses take the generic path)
+_SIMPLE_TYPES = frozenset({int, float, str, bool, type(None)})
+_SEQUENCE_TYPES = frozenset({list, tuple})
+
+
+# Class-level attributes known to resolve to methods; other descriptors (e.g.
+# functools.cached_property) may compute values and are fetched with getattr
+_METHOD_TYPES = (
+    staticmethod,
+    classmethod,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+    types.ClassMethodDescriptorType,
+)
+
+
+def _is_method_like(attr: Any) -> bool:
+    """Whether a class-level attribute resolves to a method on instances."""
+    return inspect.isfunction(attr) or isinstance(attr, _METHOD_TYPES)
+
+
+@functools.lru_cache(maxsize=2048)
+def _signature_str(func: Any, bound: bool) -> str:
+    """Formatted signature of a function, as inspect.signature would report it when bound."""
+    sig = inspect.signature(func)
+    if bound:
+        # Same rules as inspect.signature() on a bound method
+        params = tuple(sig.parameters.values())
+        if not params or params[0].kind in (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
+            raise ValueError("invalid method signature")
+        if params[0].kind != inspect.Parameter.VAR_POSITIONAL:
+            sig = sig.replace(parameters=params[1:])
+    return str(sig)
+
+
+def _method_signature(method: Any) -> str:
+    """Formatted signature of a callable, memoized on its underlying function."""
+    # Key bound methods on their function so the cache holds no instances
+    if inspect.ismethod(method):
+        return _signature_str(method.__func__, True)
+    try:
+        return _signature_str(method, False)
+    except TypeError:  # unhashable callable
+        return str(inspect.signature(method))
+
+
 def dump(
     obj: Any,
     name: str = None,
@@ -25,6 +77,12 @@ def dump(
         max_str_len: Maximum length for string representations
     """
 
+    # Bounded reprs: containers stop after a few items instead of formatting every element
+    _repr = reprlib.Repr()
+    _repr.maxstring = max_str_len
+    _repr.maxother = max_str_len
+    _repr.maxlist = _repr.maxtuple = _repr.maxset = _repr.maxdict = 3
+
     def _truncate_str(s: str, max_len: int = max_str_len) -> str:
         """Truncate long strings for readability."""
         if len(s) > max_len:
@@ -40,9 +98,10 @@ def dump(
 
     def _dump_recursive(obj, current_depth: int = 0, prefix: str = ""):
         if current_depth > depth:
-            return f"{prefix}... (max depth reached)"
+            return f"{prefix}... (max depth reached)\n"
 
-        obj_type = type(obj).__name__
+        obj_class = type(obj)
+        obj_type = obj_class.__name__
         obj_id = id(obj)
 
         # Basic info header
@@ -50,53 +109,55 @@ def dump(
         if name and current_depth == 0:
             header += f" [{name}]"
 
-        lines = [
-            header,
-            f"{prefix}Type: {obj_type}",
-            f"{prefix}ID: {obj_id}",
-            f"{prefix}Size: {_get_size(obj)}",
-        ]
+        buf = io.StringIO()
+        write = buf.write
+        write(
+            f"{header}\n"
+            f"{prefix}Type: {obj_type}\n"
+            f"{prefix}ID: {obj_id}\n"
+            f"{prefix}Size: {_get_size(obj)}\n"
+        )
 
         # Add module info if available
         if hasattr(obj, "__module__"):
-            lines.append(f"{prefix}Module: {obj.__module__}")
+            write(f"{prefix}Module: {obj.__module__}\n")
 
         # String representation
         try:
-            str_repr = _truncate_str(str(obj))
-            lines.append(f"{prefix}String repr: {str_repr}")
+            str_repr = _repr.repr(obj)
+            write(f"{prefix}String repr: {str_repr}\n")
         except Exception:
-            lines.append(f"{prefix}String repr: <cannot convert to string>")
+            write(f"{prefix}String repr: <cannot convert to string>\n")
 
         # For simple types, show value directly
-        if obj_type in ["int", "float", "str", "bool", "NoneType"]:
-            if obj_type == "str" and len(obj) > max_str_len:
-                lines.append(f"{prefix}Value: {_truncate_str(repr(obj))}")
+        if obj_class in _SIMPLE_TYPES:
+            if obj_class is str and len(obj) > max_str_len:
+                write(f"{prefix}Value: {_repr.repr(obj)}\n")
             else:
-                lines.append(f"{prefix}Value: {repr(obj)}")
+                write(f"{prefix}Value: {repr(obj)}\n")
 
         # For collections, show length and sample items
         elif hasattr(obj, "__len__"):
             try:
                 length = len(obj)
-                lines.append(f"{prefix}Length: {length}")
+                write(f"{prefix}Length: {length}\n")
 
-                if obj_type in ["list", "tuple"] and length > 0:
-                    lines.append(f"{prefix}Sample items:")
+                if obj_class in _SEQUENCE_TYPES and length > 0:
+                    write(f"{prefix}Sample items:\n")
                     for i, item in enumerate(obj[:3]):  # Show first 3 items
-                        lines.append(f"{prefix}  [{i}]: {_truncate_str(repr(item))}")
+                        write(f"{prefix}  [{i}]: {_repr.repr(item)}\n")
                     if length > 3:
-                        lines.append(f"{prefix}  ... and {length - 3} more items")
+                        write(f"{prefix}  ... and {length - 3} more items\n")
 
-                elif obj_type == "dict" and length > 0:
-                    lines.append(f"{prefix}Sample key-value pairs:")
+                elif obj_class is dict and length > 0:
+                    write(f"{prefix}Sample key-value pairs:\n")
                     for i, (k, v) in enumerate(list(obj.items())[:3]):
-                        lines.append(f"{prefix}  {repr(k)}: {_truncate_str(repr(v))}")
+                        write(f"{prefix}  {repr(k)}: {_repr.repr(v)}\n")
                     if length > 3:
-                        lines.append(f"{prefix}  ... and {length - 3} more pairs")
+                        write(f"{prefix}  ... and {length - 3} more pairs\n")
 
             except Exception:
-                lines.append(f"{prefix}Length: <cannot determine>")
+                write(f"{prefix}Length: <cannot determine>\n")
 
         # Get all attributes
         try:
@@ -109,7 +170,26 @@ def dump(
             methods = []
             other_attrs = []
 
+            # Class attributes merged along the MRO, so methods can be recognised
+            # without resolving them through the instance
+            class_attrs = {}
+            for klass in reversed(type(obj).__mro__):
+                class_attrs.update(vars(klass))
+            try:
+                instance_attrs = vars(obj)
+            except TypeError:
+                instance_attrs = {}
+
             for attr_name in all_attrs:
+                static_attr = class_attrs.get(attr_name, _MISSING)
+                if (
+                    attr_name not in instance_attrs
+                    and not inspect.isdatadescriptor(static_attr)
+                    and _is_method_like(static_attr)
+                ):
+                    methods.append((attr_name, None))
+                    continue
+
                 try:
                     attr_value = getattr(obj, attr_name)
                     if callable(attr_value):
@@ -123,52 +203,54 @@ def dump(
 
             # Show properties/attributes
             if other_attrs:
-                lines.append(f"{prefix}Attributes ({len(other_attrs)}):")
+                write(f"{prefix}Attributes ({len(other_attrs)}):\n")
                 for attr_name, attr_value in other_attrs[:10]:  # Limit to first 10
                     try:
-                        value_repr = _truncate_str(repr(attr_value))
+                        value_repr = _repr.repr(attr_value)
                         value_type = type(attr_value).__name__
-                        lines.append(
-                            f"{prefix}  {attr_name}: {value_repr} ({value_type})"
+                        write(
+                            f"{prefix}  {attr_name}: {value_repr} ({value_type})\n"
                         )
                     except Exception:
-                        lines.append(f"{prefix}  {attr_name}: <cannot represent>")
+                        write(f"{prefix}  {attr_name}: <cannot represent>\n")
                 if len(other_attrs) > 10:
-                    lines.append(
-                        f"{prefix}  ... and {len(other_attrs) - 10} more attributes"
+                    write(
+                        f"{prefix}  ... and {len(other_attrs) - 10} more attributes\n"
                     )
 
             # Show methods
             if show_methods and methods:
-                lines.append(f"{prefix}Methods ({len(methods)}):")
+                write(f"{prefix}Methods ({len(methods)}):\n")
                 for method_name, method_obj in methods[:10]:  # Limit to first 10
                     try:
-                        sig = inspect.signature(method_obj)
-                        lines.append(f"{prefix}  {method_name}{sig}")
+                        if method_obj is None:
+                            method_obj = getattr(obj, method_name)
+                        sig = _method_signature(method_obj)
+                        write(f"{prefix}  {method_name}{sig}\n")
                         if show_docs and method_obj.__doc__:
                             doc = _truncate_str(method_obj.__doc__.strip())
-                            lines.append(f"{prefix}    → {doc}")
+                            write(f"{prefix}    → {doc}\n")
                     except Exception:
-                        lines.append(f"{prefix}  {method_name}(...)")
+                        write(f"{prefix}  {method_name}(...)\n")
                 if len(methods) > 10:
-                    lines.append(f"{prefix}  ... and {len(methods) - 10} more methods")
+                    write(f"{prefix}  ... and {len(methods) - 10} more methods\n")
 
         except Exception as e:
-            lines.append(f"{prefix}Error getting attributes: {e}")
+            write(f"{prefix}Error getting attributes: {e}\n")
 
         # Show class hierarchy
         try:
             mro = obj.__class__.__mro__
             if len(mro) > 1:
-                lines.append(
-                    f"{prefix}Class hierarchy: {' → '.join([cls.__name__ for cls in mro])}"
+                write(
+                    f"{prefix}Class hierarchy: {' → '.join([cls.__name__ for cls in mro])}\n"
                 )
         except Exception:
             pass
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
-    print(_dump_recursive(obj))
+    print(_dump_recursive(obj), end="")
 
 
 # Convenience functions for common use cases
@@ -4,75 +4,101 @@ from pathlib import Path
 from typing import Optional
 
 
-def setup_logger(
-    name: str,
-    log_file: Optional[str] = None,
+# Shared by every handler; formatters hold no per-logger state
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# Log file of the root handlers installed by configure_logging
+DEFAULT_LOG_FILE = "app.log"
+
+# Set once the root logger has its handlers, later loggers just propagate to it
+_ROOT_CONFIGURED = False
+
+
+def configure_logging(
+    log_file: Optional[str] = DEFAULT_LOG_FILE,
     level: int = logging.INFO,
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
     backup_count: int = 5
-) -> logging.Logger:
+) -> None:
     """
-    Set up a logger with consistent configuration.
-    
+    Attach the console and rotating file handlers to the root logger.
+
+    Only the first call in the process takes effect; every logger then propagates
+    to these handlers instead of owning its own. Per-logger levels are set by setup_logger.
+
     Args:
-        name: Logger name (usually __name__)
         log_file: Optional log file path (relative to logs/ directory)
-        level: Logging level
+        level: Lowest level the root logger lets through
         max_bytes: Maximum log file size before rotation
         backup_count: Number of backup log files to keep
-    
-    Returns:
-        Configured logger instance
     """
-    logger = logging.getLogger(name)
-    
-    # Avoid adding handlers if they already exist
-    if logger.handlers:
-        return logger
-    
-    logger.setLevel(level)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
+    global _ROOT_CONFIGURED
+
+    if _ROOT_CONFIGURED:
+        return
+
+    root = logging.getLogger()
+    root.setLevel(min(root.level, level))
+
+    # Console handler, unless one was already installed (e.g. by logging.basicConfig)
+    if not any(type(handler) is logging.StreamHandler for handler in root.handlers):
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(_FORMATTER)
+        root.addHandler(console_handler)
+
     # File handler (if specified)
     if log_file:
         # Ensure logs directory exists
         logs_dir = Path("logs")
         logs_dir.mkdir(exist_ok=True)
-        
+
         log_path = logs_dir / log_file
-        
+
         # Use rotating file handler to manage log file size
         file_handler = logging.handlers.RotatingFileHandler(
             log_path,
             maxBytes=max_bytes,
             backupCount=backup_count
         )
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
+        file_handler.setFormatter(_FORMATTER)
+        root.addHandler(file_handler)
+
+    _ROOT_CONFIGURED = True
+
+
+def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
+    """
+    Set up a logger with consistent configuration.
+
+    The logger gets no handlers of its own; its records propagate to the root
+    handlers installed by configure_logging().
+
+    Args:
+        name: Logger name (usually __name__)
+        level: Logging level
+
+    Returns:
+        Configured logger instance
+    """
+    configure_logging()
+
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    logger.propagate = True
     return logger
 
 
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with default configuration.
-    
+
     Args:
         name: Logger name (usually __name__)
-    
+
     Returns:
         Logger instance
     """
-    return setup_logger(name, f"{name.replace('.', '_')}.log") 
\ No newline at end of file
+    return setup_logger(name)
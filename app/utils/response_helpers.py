@@ -1,3 +1,4 @@
+import re
 from typing import Any, Dict, List, Optional
 from fastapi import HTTPException, status
 from app.models.common_models import (
@@ -10,6 +11,28 @@ from app.models.common_models import (
 )
 
 
+# Error message phrases, matched in a single scan of the message
+_ERROR_PHRASE_RE = re.compile(
+    r"(?P<not_found>not found)"
+    r"|(?P<conflict>already exists|conflict)"
+    r"|(?P<unavailable>not connected|unavailable)"
+    r"|(?P<busy>busy)"
+    r"|(?P<timeout>timeout)"
+    r"|(?P<bad_request>bad request|invalid)",
+    re.IGNORECASE,
+)
+
+# HTTP status per phrase group, highest priority first
+_ERROR_STATUS_CODES = {
+    "not_found": status.HTTP_404_NOT_FOUND,
+    "conflict": status.HTTP_409_CONFLICT,
+    "unavailable": status.HTTP_503_SERVICE_UNAVAILABLE,
+    "busy": status.HTTP_409_CONFLICT,
+    "timeout": status.HTTP_408_REQUEST_TIMEOUT,
+    "bad_request": status.HTTP_400_BAD_REQUEST,
+}
+
+
 def create_success_response(
     message: str, 
     data: Optional[Dict[str, Any]] = None
@@ -69,14 +92,14 @@ def create_paginated_response(
     per_page: int
 ) -> PaginatedResponse:
     """Create a standardized paginated response"""
-    total_pages = (total + per_page - 1) // per_page
-    return PaginatedResponse(
+    # Arguments are already typed by the caller, so skip field validation
+    return PaginatedResponse.model_construct(
         message=f"Retrieved {len(data)} items",
         data=data,
         total=total,
         page=page,
         per_page=per_page,
-        has_next=page < total_pages,
+        has_next=page * per_page < total,
         has_prev=page > 1
     )
 
@@ -101,22 +124,14 @@ def handle_service_error(
     default_status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
 ) -> None:
     """Handle service errors and raise appropriate HTTP exceptions"""
-    error_message = f"Failed to {operation}: {str(error)}"
+    error_text = str(error)
+    error_message = f"Failed to {operation}: {error_text}"
     
     # Map specific exceptions to appropriate HTTP status codes
-    if "not found" in str(error).lower():
-        status_code = status.HTTP_404_NOT_FOUND
-    elif "already exists" in str(error).lower() or "conflict" in str(error).lower():
-        status_code = status.HTTP_409_CONFLICT
-    elif "not connected" in str(error).lower() or "unavailable" in str(error).lower():
-        status_code = status.HTTP_503_SERVICE_UNAVAILABLE
-    elif "busy" in str(error).lower():
-        status_code = status.HTTP_409_CONFLICT
-    elif "timeout" in str(error).lower():
-        status_code = status.HTTP_408_REQUEST_TIMEOUT
-    elif "bad request" in str(error).lower() or "invalid" in str(error).lower():
-        status_code = status.HTTP_400_BAD_REQUEST
-    else:
-        status_code = default_status_code
+    matched = {match.lastgroup for match in _ERROR_PHRASE_RE.finditer(error_text)}
+    status_code = next(
+        (code for group, code in _ERROR_STATUS_CODES.items() if group in matched),
+        default_status_code,
+    )
     
     raise_http_exception(status_code, error_message) 
\ No newline at end of file